@@ -1,2 +0,0 @@
-from .funs import prettify_result
-from .funs import prettify_results
\ No newline at end of file
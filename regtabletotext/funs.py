@@ -1,6 +1,11 @@
 # ====================
 # SECTION: Imports
 # ====================
+import functools
+import operator
+import re
+import weakref
+from collections import namedtuple
 import pandas as pd
 import numpy as np
 from tabulate import tabulate
@@ -8,45 +13,186 @@ from tabulate import tabulate
 # ====================
 # SECTION: Constants
 # ====================
-ALLOWED_OPTIONS = {'digits', 'include_residuals', 'max_width'}
+ALLOWED_OPTIONS = frozenset({'digits', 'include_residuals', 'max_width'})
+
+# Options of prettify_result() with their defaults, parsed once per call
+PrettifyOptions = namedtuple('PrettifyOptions', ['digits', 'include_residuals', 'max_width'], defaults=[3, False, 80])
+
 TYPE_STATSMODELS = 'statsmodels.regression.linear_model.RegressionResultsWrapper'
 TYPE_LINEARMODELS = 'linearmodels.panel.results.PanelEffectsResults'
 TYPE_ARCH_MODEL = 'arch.univariate.base.ARCHModelResult'
-SUPPORTED_MODELS = {TYPE_STATSMODELS, TYPE_LINEARMODELS, TYPE_ARCH_MODEL}
+SUPPORTED_MODELS = frozenset({TYPE_STATSMODELS, TYPE_LINEARMODELS, TYPE_ARCH_MODEL})
+
+# Output specifications of prettify_result() by result type. The footer lines are templates for 
+# str.format_map() with the number of digits as '{digits}', filled with the result attributes 
+# listed in 'footer_values'. The F-statistic line is only used if the F-statistic is available.
+MODEL_SPECS = {
+    TYPE_STATSMODELS: {
+        'header': "OLS Model",
+        'residuals': "resid",
+        'footer_lines': (
+            "- Number of observations: {nobs:,.0f}",
+            "- R-squared: {rsquared:.{digits}f}, Adjusted R-squared: {rsquared_adj:.{digits}f}",
+        ),
+        'f_statistic_line': "- F-statistic: {f_statistic:,.{digits}f} on {df_model:.0f} and {df_resid:.0f} DF, p-value: {f_pvalue:.{digits}f}",
+        'footer_values': {
+            'nobs': "nobs",
+            'rsquared': "rsquared",
+            'rsquared_adj': "rsquared_adj",
+            'f_statistic': "fvalue",
+            'df_model': "df_model",
+            'df_resid': "df_resid",
+            'f_pvalue': "f_pvalue"
+        }
+    },
+    TYPE_LINEARMODELS: {
+        'header': "Panel OLS Model",
+        'residuals': "resids",
+        'footer_lines': (
+            "- Number of observations: {nobs:,.0f}",
+            "- R-squared (incl. FE): {rsquared_inclusive:.{digits}f}, Within R-squared: {rsquared_within:.{digits}f}",
+        ),
+        'f_statistic_line': "- F-statistic: {f_statistic:,.{digits}f}, p-value: {f_pvalue:.{digits}f}",
+        'footer_values': {
+            'nobs': "nobs",
+            'rsquared_inclusive': "rsquared_inclusive",
+            'rsquared_within': "rsquared_within",
+            'f_statistic': "f_statistic.stat",
+            'f_pvalue': "f_statistic.pval"
+        }
+    },
+    TYPE_ARCH_MODEL: {
+        'header': None,
+        'residuals': "resid",
+        'footer_lines': (
+            "- Number of observations: {nobs:,.0f}",
+            "- Distribution: {distribution!s}",
+            "- Multiple R-squared: {rsquared:.{digits}f}, Adjusted R-squared: {rsquared_adj:.{digits}f}",
+            "- BIC: {bic:,.{digits}f},  AIC: {aic:,.{digits}f}",
+        ),
+        'f_statistic_line': None,
+        'footer_values': {
+            'nobs': "nobs",
+            'distribution': "model.distribution",
+            'rsquared': "rsquared",
+            'rsquared_adj': "rsquared_adj",
+            'bic': "bic",
+            'aic': "aic"
+        }
+    }
+}
+
+# Runs of whitespace that are collapsed in model formulas
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# Cache of result summaries, released together with their result objects
+_SUMMARY_CACHE = weakref.WeakKeyDictionary()
 
 # ===================
 # SECTION: Validation Functions
 # ====================
+@functools.lru_cache(maxsize=32)
+def classify_result_class(result_class):
+    result_type = result_class.__module__ + "." + result_class.__name__
+    return(result_type if result_type in SUPPORTED_MODELS else None)
+
+def get_result_type(result):
+    return(classify_result_class(type(result)))
+
 def is_result_type_valid(result):
-    result_type = type(result).__module__ + "." + type(result).__name__
-    return(result_type in SUPPORTED_MODELS)
+    return(get_result_type(result) is not None)
 
 def is_result_type_statsmodels(result):
-    result_type = type(result).__module__ + "." + type(result).__name__
-    return(result_type in TYPE_STATSMODELS)
+    return(get_result_type(result) == TYPE_STATSMODELS)
 
 def is_result_type_linearmodels(result):
-    result_type = type(result).__module__ + "." + type(result).__name__
-    return(result_type in TYPE_LINEARMODELS)
+    return(get_result_type(result) == TYPE_LINEARMODELS)
 
 def are_result_type_linearmodels(results):
+    # Results of a single class only need the class name checked once
+    if len(results) > 0:
+        first_class = type(results[0])
+        if all(type(result) is first_class for result in results):
+            return(is_result_type_linearmodels(results[0]))
     return all(is_result_type_linearmodels(result) for result in results)
 
 def is_result_type_arch_model(result):
-    result_type = type(result).__module__ + "." + type(result).__name__
-    return(result_type in TYPE_ARCH_MODEL)
+    return(get_result_type(result) == TYPE_ARCH_MODEL)
 
 # ===================
 # SECTION: Helper Functions
 # ====================
+def get_result_summary(result):
+    """
+    Return the summary of a regression result, building it only on first use.
+
+    Building the summary formats every table of the result, so it is cached per result object 
+    and reused by subsequent calls. Cache entries are dropped when the result is garbage collected.
+
+    Parameters:
+    - result: A supported regression result object.
+
+    Returns:
+    - Summary: The summary object of the result, whose 'tables' hold the formatted output.
+    """
+    summary = _SUMMARY_CACHE.get(result)
+    if summary is None:
+        # linearmodels exposes the summary as a property, the other packages as a method
+        if get_result_type(result) == TYPE_LINEARMODELS:
+            summary = result.summary
+        else:
+            summary = result.summary()
+        _SUMMARY_CACHE[result] = summary
+    return summary
+
+def wrap_model_formula(model_formula, max_width=80):
+    """
+    Split a cleaned model formula into lines that fit within a specified width.
+
+    The formula is split into its terms at the '+' signs, and the terms are added to the current 
+    line for as long as it fits within `max_width`. Continuation lines are printed with a leading 
+    ' + ', which is accounted for in their width. A term that is wider than a line on its own 
+    is kept on a separate line, and the remaining terms are wrapped after it.
+
+    Parameters:
+    ----------
+    model_formula : str
+        The model formula without extra spaces, e.g., "y ~ x1 + x2 + x3".
+    max_width : int
+        The maximum width (number of characters) of a single line (default: 80).
+
+    Yields:
+    -------
+    str
+        The parts of the formula between the chosen '+' signs.
+    """
+
+    terms = model_formula.split('+')
+    line_terms = [terms[0]]
+    line_length = len(terms[0])
+    for term_number, term in enumerate(terms[1:], start=2):
+        # Lines before a break keep to max_width - 1 characters, the cutoff of the former
+        # rfind('+', 0, max_width) split; only the last line may use the full width
+        available_width = max_width if term_number == len(terms) else max_width - 1
+        if line_length + 1 + len(term) <= available_width:
+            line_terms.append(term)
+            line_length += 1 + len(term)
+        else:
+            yield '+'.join(line_terms)
+            line_terms = [term]
+            # Continuation lines are printed as ' + ' followed by the term without its leading space
+            line_length = 3 + len(term.lstrip())
+    yield '+'.join(line_terms)
+
 def clean_model_formula(model_formula, options={'max_width': 80}):
     """
     Cleans and formats a given model formula to fit within a specified width.
 
     This function takes a model formula as input, removes any extra spaces, and ensures that the 
     formula does not exceed the specified maximum width (`max_width`). If the formula exceeds the 
-    `max_width`, it splits the formula at the last '+' sign before the `max_width` and continues 
-    the formula on the next line.
+    `max_width`, it is wrapped at '+' signs over as many lines as needed, and each continuation 
+    line starts with ' + '. A term that is wider than `max_width` on its own is kept on a line 
+    of its own.
 
     Parameters:
     ----------
@@ -63,15 +209,21 @@ def clean_model_formula(model_formula, options={'max_width': 80}):
     """
 
     max_width = options.get('max_width')
+
+    # Return formulas without extra whitespace that fit on one line as they are. The length is 
+    # checked first; isprintable() is False for every whitespace character except the space.
+    if (len(model_formula) <= max_width and model_formula.isprintable()
+            and '  ' not in model_formula
+            and not model_formula.startswith(' ') and not model_formula.endswith(' ')):
+        return model_formula
         
-    model_formula_cleaned = ' '.join(model_formula.split())
+    model_formula_cleaned = _WHITESPACE_PATTERN.sub(' ', model_formula).strip()
 
     if len(model_formula_cleaned) <= max_width:
         return model_formula_cleaned
     else:
-        # Split the formula at the last '+' before max_width
-        split_index = model_formula_cleaned.rfind('+', 0, max_width)
-        return model_formula_cleaned[:split_index] + '\n + ' + model_formula_cleaned[split_index+1:].strip()
+        # Split the formula at the last '+' before max_width, as often as needed
+        return '\n + '.join(line.strip() for line in wrap_model_formula(model_formula_cleaned, max_width))
 
 def calculate_residuals_statistics(residuals, options={'digits': 3}):
     """
@@ -96,10 +248,27 @@ def calculate_residuals_statistics(residuals, options={'digits': 3}):
     # Extract options or use defaults
     digits = options.get('digits')
 
-    residuals_stats = residuals.describe().iloc[1:]
-    residuals_stats.index = [i.capitalize() for i in residuals_stats.index]
-    residuals_stats = pd.DataFrame(residuals_stats).T.round(digits)
-    residuals_stats.index.name = None
+    # Convert the residuals once to a contiguous float array without missing values
+    residuals = np.ascontiguousarray(residuals, dtype=np.float64)
+    missing = np.isnan(residuals)
+    if missing.any():
+        residuals = residuals[~missing]
+
+    # Without residuals all statistics are missing, as with Series.describe()
+    if residuals.size == 0:
+        residuals_stats = np.full(7, np.nan)
+    else:
+        # Compute all quantiles in a single pass and round the seven statistics before building the frame
+        residuals_quantiles = np.percentile(residuals, [0, 25, 50, 75, 100], method='linear')
+        # A single residual has no sample standard deviation, which numpy would warn about
+        residuals_std = residuals.std(ddof=1) if residuals.size > 1 else np.nan
+        residuals_stats = np.round(
+            [residuals.mean(), residuals_std, *residuals_quantiles], digits
+        )
+    residuals_stats = pd.DataFrame(
+        [residuals_stats],
+        columns=["Mean", "Std", "Min", "25%", "50%", "75%", "Max"]
+    )
 
     return residuals_stats
 
@@ -115,21 +284,54 @@ def truncate_coefficients_table(coefficients_table, options={'max_width': 80}):
     
     max_width = options.get('max_width')
 
-    # Truncate coefficient names if they exceed max_width
-    for index, row in coefficients_table.iterrows():
-        coeff_name = index
-        values_str = ' '.join(map(str, row.values))
+    # Compute the widths of all coefficient names and space-separated row values at once,
+    # stringifying the values in one array operation instead of joining strings row by row
+    coeff_names = coefficients_table.index.to_numpy(dtype=str)
+    values = coefficients_table.to_numpy()
+    values_lengths = np.char.str_len(values.astype(str)).sum(axis=1) + values.shape[1] - 1
+
+    # Check which combined widths exceed max_width
+    overflow = np.char.str_len(coeff_names) + values_lengths + 20 > max_width
+    if not overflow.any():
+        return coefficients_table
+
+    # Truncate only the coefficient names that exceed max_width
+    coeff_names = coeff_names.astype(object)
+    trunc_lengths = max_width - values_lengths - 23
+    for i in np.flatnonzero(overflow):
+        coeff_names[i] = coeff_names[i][:trunc_lengths[i]] + "..."
+
+    # Update the index in the DataFrame once
+    coefficients_table = coefficients_table.set_axis(
+        pd.Index(coeff_names, name=coefficients_table.index.name), axis=0)
+    return coefficients_table
 
-        # Check if the combined width exceeds max_width
-        if len(coeff_name) + len(values_str) + 20 > max_width:
-            # Calculate how much to truncate the coefficient name
-            trunc_length = max_width - len(values_str) - 23
-            truncated_name = coeff_name[:trunc_length] + "..."
+def convert_coefficients_data(result_data, columns, digits=3):
+    """
+    Convert the raw data of a summary coefficients table to a numeric DataFrame.
+    Parameters:
+    - result_data, list of rows of the summary table with the column names in the first row
+    - columns, dict mapping the columns to keep to their new names
+    - digits, int number of decimal places to round the values to
+    Returns:
+    - pd.DataFrame: A DataFrame with the renamed columns, indexed by coefficient name
+    """
 
-            # Update the index in the DataFrame
-            coefficients_table = coefficients_table.rename(
-                index={coeff_name: truncated_name})
-    return coefficients_table
+    # Transpose the raw rows and select the needed columns before building a data frame
+    column_positions = {column: i for i, column in enumerate(result_data[0])}
+    data_columns = list(zip(*result_data[1:])) or [()] * len(column_positions)
+    coeff_names = data_columns[column_positions[""]]
+    flat_values = [value for column in columns for value in data_columns[column_positions[column]]]
+
+    # Convert and round all values in single passes over the flattened data
+    values = pd.to_numeric(flat_values, errors='coerce')
+    values = np.round(values, digits).reshape(len(columns), -1).T
+
+    return pd.DataFrame(
+        values, 
+        index=pd.Index(coeff_names, name=""), 
+        columns=list(columns.values())
+    )
 
 def create_coefficients_table(result, options={'digits': 3, 'max_width': 80}):
     """
@@ -161,7 +363,8 @@ def create_coefficients_table(result, options={'digits': 3, 'max_width': 80}):
     """
 
     # Check if the result object is valid
-    if not is_result_type_valid(result):
+    result_type = get_result_type(result)
+    if result_type is None:
         raise ValueError("The 'result' parameter should be a single regression result object from statsmodels or linearmodels.")
     
     # Extract options or use defaults
@@ -171,99 +374,67 @@ def create_coefficients_table(result, options={'digits': 3, 'max_width': 80}):
     # Initialize output list
     coefficients_tables_list = []
     
-    if is_result_type_statsmodels(result):
+    if result_type == TYPE_STATSMODELS:
         # Extract result 
-        result_data = result.summary().tables[1].data
+        result_data = get_result_summary(result).tables[1].data
 
         # Check if 't' column is present, otherwise use 'z' column
-        column_to_use = 't' if 't' in result_data[0] else 'z'
-        p_value_column = 'P>|t|' if 't' in result_data[0] else 'P>|z|'
+        column_to_use, p_value_column = ('t', 'P>|t|') if 't' in result_data[0] else ('z', 'P>|z|')
 
         # Collect coefficient statistics in a data frame
-        coefficients_table = (
-            pd.DataFrame(result_data[1:], columns=result_data[0])
-            .get(["", "coef", "std err", column_to_use, p_value_column])
-            .rename(columns={
-                "coef": "Estimate",
-                "std err": "Std. Error",
-                column_to_use: "t-Statistic",
-                p_value_column: "p-Value"
-            })
-            .set_index("")
-            .apply(pd.to_numeric, errors='coerce')
-            .round(digits)
-        )
-
-    if is_result_type_linearmodels(result):
+        coefficients_table = convert_coefficients_data(result_data, columns={
+            "coef": "Estimate",
+            "std err": "Std. Error",
+            column_to_use: "t-Statistic",
+            p_value_column: "p-Value"
+        }, digits=digits)
+
+    elif result_type == TYPE_LINEARMODELS:
         # Extract result 
-        result_data = result.summary.tables[1].data
+        result_data = get_result_summary(result).tables[1].data
 
         # Collect coefficient statistics in a data frame
-        coefficients_table = (pd.DataFrame(
-                result_data[1:], 
-                columns=result_data[0]
-            )
-            .get(["", "Parameter", "Std. Err.", "T-stat", "P-value"])
-            .rename(columns={
-                "Parameter": "Estimate",
-                "Std. Err.": "Std. Error",
-                "T-stat": "t-Statistic",
-                "P-value": "p-Value"
-                },
-            )
-            .set_index("")
-            .apply(pd.to_numeric, errors='coerce')
-            .round(digits)
-        )
-
-    if is_result_type_arch_model(result):
+        coefficients_table = convert_coefficients_data(result_data, columns={
+            "Parameter": "Estimate",
+            "Std. Err.": "Std. Error",
+            "T-stat": "t-Statistic",
+            "P-value": "p-Value"
+        }, digits=digits)
+
+    elif result_type == TYPE_ARCH_MODEL:
         # Extract result
-        result_data = result.summary().tables[1].data
+        summary = get_result_summary(result)
+        result_data = summary.tables[1].data
 
         # Check if 't' column is present, otherwise use 'z' column
-        column_to_use = 't' if 't' in result_data[0] else 'z'
-        p_value_column = 'P>|t|' if 't' in result_data[0] else 'P>|z|'
+        column_to_use, p_value_column = ('t', 'P>|t|') if 't' in result_data[0] else ('z', 'P>|z|')
 
         # Collect coefficient statistics in a data frame
-        coefficients_table = (
-            pd.DataFrame(result_data[1:], columns=result_data[0])
-            .get(["", "coef", "std err", column_to_use, p_value_column])
-            .rename(columns={
-                "coef": "Estimate",
-                "std err": "Std. Error",
-                column_to_use: "t-Statistic",
-                p_value_column: "p-Value"
-            })
-            .set_index("")
-            .apply(pd.to_numeric, errors='coerce')
-            .round(digits)
-        )
+        coefficients_table = convert_coefficients_data(result_data, columns={
+            "coef": "Estimate",
+            "std err": "Std. Error",
+            column_to_use: "t-Statistic",
+            p_value_column: "p-Value"
+        }, digits=digits)
 
         # Extract result
-        result_data_vola = result.summary().tables[2].data
+        result_data_vola = summary.tables[2].data
 
         # Collect coefficient statistics in a data frame
-        coefficients_table_vola = (
-            pd.DataFrame(result_data_vola[1:], columns=result_data_vola[0])
-            .get(["", "coef", "std err", column_to_use, p_value_column])
-            .rename(columns={
-                "coef": "Estimate",
-                "std err": "Std. Error",
-                column_to_use: "t-Statistic",
-                p_value_column: "p-Value"
-            })
-            .set_index("")
-            .apply(pd.to_numeric, errors='coerce')
-            .round(digits)
-        )
-        coefficients_table_vola = truncate_coefficients_table(coefficients_table_vola, options={'max_width': max_width})
+        coefficients_table_vola = convert_coefficients_data(result_data_vola, columns={
+            "coef": "Estimate",
+            "std err": "Std. Error",
+            column_to_use: "t-Statistic",
+            p_value_column: "p-Value"
+        }, digits=digits)
+        coefficients_table_vola = truncate_coefficients_table(coefficients_table_vola, options=options)
         coefficients_table_vola.index.name = None
 
-    coefficients_table = truncate_coefficients_table(coefficients_table, options={'max_width': max_width})
+    coefficients_table = truncate_coefficients_table(coefficients_table, options=options)
     coefficients_table.index.name = None
     coefficients_tables_list.append(coefficients_table)
 
-    if is_result_type_arch_model(result):
+    if result_type == TYPE_ARCH_MODEL:
         coefficients_tables_list.append(coefficients_table_vola)
 
     return coefficients_tables_list
@@ -292,6 +463,32 @@ def create_fixed_effects_table(result):
 
     return(fixed_effects_table)
 
+@functools.lru_cache(maxsize=16)
+def create_footer_template(result_type, digits=3, f_statistic_available=True):
+    """
+    Create the template of the summary statistics footer for a result type.
+
+    The number of digits is written into the format specifications of the template, which is 
+    cached so that repeated calls with the same options only need to fill in the values.
+
+    Parameters:
+    - result_type: One of the supported result types, which selects the lines in MODEL_SPECS.
+    - digits: Number of decimal places to format the statistics with (default: 3).
+    - f_statistic_available: Whether the template includes the F-statistic (default: True).
+
+    Returns:
+    - str: A template for str.format_map() with the fields of 'footer_values' in MODEL_SPECS.
+    """
+    model_spec = MODEL_SPECS[result_type]
+    footer_lines = ["Summary statistics:", *model_spec['footer_lines']]
+    if model_spec['f_statistic_line'] is not None:
+        if f_statistic_available:
+            footer_lines.append(model_spec['f_statistic_line'])
+        else:
+            footer_lines.append("- F-statistic not available")
+
+    return "\n".join(footer_lines).replace("{digits}", str(digits)) + "\n"
+
 # ===================
 # SECTION: Main Functions
 # ====================
@@ -322,107 +519,76 @@ def prettify_result(result, options={'digits': 3, 'include_residuals': False, 'm
     None
         The function prints the formatted summary directly.
     """
+    # Check if options are valid
+    if not options.keys() <= ALLOWED_OPTIONS:
+        invalid_options = options.keys() - ALLOWED_OPTIONS
+        raise ValueError(f"Invalid options provided: {', '.join(invalid_options)}")
+
     # Pass to prettify_results() if the result object is a list
     if (isinstance(result, list)):
-        return(prettify_results(result))
+        return(prettify_results(result, options=options))
 
     # Check if the result object is valid
-    if not is_result_type_valid(result):
+    result_type = get_result_type(result)
+    if result_type is None:
         raise ValueError("The 'result' parameter is currently not supported.")
     
-    # Check if options are valid
-    invalid_options = set(options.keys()) - ALLOWED_OPTIONS
-    if invalid_options:
-        raise ValueError(f"Invalid options provided: {', '.join(invalid_options)}")
-    
-    # Extract options or use defaults
-    digits = options.get('digits', 3)
-    include_residuals = options.get('include_residuals', False)
-    max_width = options.get('max_width', 80)
-
-    if is_result_type_statsmodels(result):
-        # Initialize the output string
-        if (hasattr(result.model, "formula")):
-            model_formula = clean_model_formula(result.model.formula, options={'max_width': max_width})
-            output = f"OLS Model:\n{model_formula}\n\n"
-        else:
-            output = f"OLS Model (no formula provided)\n\n"
-        
-        # Add residuals to the output string if required
-        if include_residuals:
-            residuals_statistics = calculate_residuals_statistics(result.resid, options={'digits': digits}).to_string(index=False)
-            output += f"Residuals:\n{residuals_statistics}\n\n"
-
-        # Add coefficients to the output string
-        coefficients_table = create_coefficients_table(result, options={'digits': digits, 'max_width': max_width})[0].to_string()
-        output += f"Coefficients:\n{coefficients_table}\n\n"
-
-        # Add footer with additional statistics to the output string
-        output += (
-            f"Summary statistics:\n"
-            f"- Number of observations: {result.nobs:,.0f}\n"
-            f"- R-squared: {result.rsquared:.{digits}f}, Adjusted R-squared: {result.rsquared_adj:.{digits}f}\n"
-        )
-        if (np.isnan(result.fvalue)):
-            output += f"- F-statistic not available\n"
-        else:
-            output += f"- F-statistic: {result.fvalue:,.{digits}f} on {result.df_model:.0f} and {result.df_resid:.0f} DF, p-value: {result.f_pvalue:.{digits}f}\n"
+    # Extract options or use defaults, and share one options dict between all helpers
+    prettify_options = PrettifyOptions(**options)
+    helper_options = prettify_options._asdict()
 
-    
-    if is_result_type_linearmodels(result):
-        # Initialize the output string
-        output = f"Panel OLS Model:\n{clean_model_formula(result.model.formula)}\n\n"
-        
-        # Add covariance type
-        output += f"Covariance Type: {result._cov_type}\n\n"
-
-        # Add residuals to the output string if required
-        if include_residuals:
-            # Assuming you have a function called 'calculate_residuals_statistics' for linearmodels
-            residual_statistics = calculate_residuals_statistics(result.resids, options={'digits': digits}).to_string(index=False)
-            output += f"Residuals:\n{residual_statistics}\n\n"
-
-        # Add coefficients to the output string
-        coefficients_table = create_coefficients_table(result, options={'digits': digits, 'max_width': max_width})[0].to_string()
-        output += f"Coefficients:\n{coefficients_table}\n\n"
-
-        # Include table with included fixed effects (if any)
-        if len(result.included_effects) > 0:
-            fixed_effects_table = create_fixed_effects_table(result).to_string()
-            output += f"Included Fixed Effects:\n{fixed_effects_table}\n\n"            
-
-        # Add footer with additional statistics to the output string
-        output += (
-            f"Summary statistics:\n"
-            f"- Number of observations: {result.nobs:,.0f}\n"
-            f"- R-squared (incl. FE): {result.rsquared_inclusive:.{digits}f}, Within R-squared: {result.rsquared_within:.{digits}f}\n"
-        )
-        if (np.isnan(result.f_statistic.stat)):
-            f"- F-statistic not available\n"
-        else:
-            f"- F-statistic: {result.f_statistic.stat:,.{digits}f}, p-value: {result.f_statistic.pval:.{digits}f}\n"
-
-    if is_result_type_arch_model(result):
-        model_name = result.summary().as_text().split('\n')[0].strip()
-        output = f"\n{model_name}\n\n"
-        if include_residuals:
-            residuals_statistics = calculate_residuals_statistics(result.resid, options={'digits': digits}).to_string(index=False)
-            output += f"Residuals:\n{residuals_statistics}\n\n"
-
-        # Add coefficients to the output string
-        output += f"Mean Coefficients:\n{create_coefficients_table(result, options={'digits': digits, 'max_width': max_width})[0].to_string()}\n\n"
-        output += f"Coefficients for {str(result.model.volatility)}:\n{create_coefficients_table(result, options={'digits': digits, 'max_width': max_width})[1].to_string()}\n\n"
-
-        # Add footer with additional statistics to the output string
-        output += (
-            f"Summary statistics:\n"
-            f"- Number of observations: {result.nobs:,.0f}\n"
-            f"- Distribution: {str(result.model.distribution)}\n"
-            f"- Multiple R-squared: {result.rsquared:.{digits}f}, Adjusted R-squared: {result.rsquared_adj:.{digits}f}\n"
-            f"- BIC: {result.bic:,.{digits}f},  AIC: {result.aic:,.{digits}f}\n"
-        )
+    model_spec = MODEL_SPECS[result_type]
+
+    # Collect the sections of the output, which are separated by blank lines
+    output_sections = []
 
-    # Print the output string
+    if result_type == TYPE_ARCH_MODEL:
+        # The title of the first summary table is the model name
+        model_name = get_result_summary(result).tables[0].title.strip()
+        output_sections.append(f"\n{model_name}")
+    else:
+        # Add the model formula
+        model_formula = getattr(result.model, "formula", None)
+        if model_formula is not None:
+            model_formula = clean_model_formula(model_formula, options=helper_options)
+            output_sections.append(f"{model_spec['header']}:\n{model_formula}")
+        else:
+            output_sections.append(f"{model_spec['header']} (no formula provided)")
+
+    # Add covariance type
+    if result_type == TYPE_LINEARMODELS:
+        output_sections.append(f"Covariance Type: {result._cov_type}")
+
+    # Add residuals to the output if required
+    if prettify_options.include_residuals:
+        residuals = getattr(result, model_spec['residuals'])
+        residuals_statistics = calculate_residuals_statistics(residuals, options=helper_options).to_string(index=False)
+        output_sections.append(f"Residuals:\n{residuals_statistics}")
+
+    # Add coefficients to the output
+    coefficients_tables = create_coefficients_table(result, options=helper_options)
+    if result_type == TYPE_ARCH_MODEL:
+        output_sections.append(f"Mean Coefficients:\n{coefficients_tables[0].to_string()}")
+        output_sections.append(f"Coefficients for {str(result.model.volatility)}:\n{coefficients_tables[1].to_string()}")
+    else:
+        output_sections.append(f"Coefficients:\n{coefficients_tables[0].to_string()}")
+
+    # Include table with included fixed effects (if any)
+    if result_type == TYPE_LINEARMODELS and len(result.included_effects) > 0:
+        fixed_effects_table = create_fixed_effects_table(result).to_string()
+        output_sections.append(f"Included Fixed Effects:\n{fixed_effects_table}")
+
+    # Add footer with additional statistics to the output
+    footer_values = {
+        name: operator.attrgetter(attribute)(result) 
+        for name, attribute in model_spec['footer_values'].items()
+    }
+    f_statistic_available = 'f_statistic' in footer_values and not np.isnan(footer_values['f_statistic'])
+    footer_template = create_footer_template(result_type, prettify_options.digits, f_statistic_available)
+    output_sections.append(footer_template.format_map(footer_values))
+
+    # Join the sections once and print the output string
+    output = "\n\n".join(output_sections)
     return(print(output))
 
 def prettify_results(results, options={'digits': 3}):
@@ -456,17 +622,27 @@ def prettify_results(results, options={'digits': 3}):
     dependent_vars.insert(0, "Dependent var.")
 
     # Coefficients with t-stats in parentheses 
-    dfs = []
+    combined_series = {}
     for i, result in enumerate(results):
         table = create_coefficients_table(result)[0]
-        coefs = table.get("Estimate").round(digits)
-        tstats = table.get("t-Statistic").round(2)
-        combined = coefs.astype(str) + " (" + tstats.astype(str) + ")"
-        dfs.append(combined.to_frame(name=f'Estimate_{i+1}'))
-
-    merged_df = pd.concat(dfs, axis=1, join='outer')
-
-    coefficients = merged_df.reset_index().fillna('').astype(str).values.tolist()
+        coefs = table.get("Estimate").round(digits).to_numpy().astype(str)
+        tstats = table.get("t-Statistic").round(2).to_numpy().astype(str)
+        combined = pd.Series(
+            np.char.add(np.char.add(coefs, " ("), np.char.add(tstats, ")")), 
+            index=table.index
+        )
+        combined_series[f'Estimate_{i+1}'] = combined
+
+    # Build one data frame indexed by all coefficient names in order of appearance
+    coefficient_names = list(dict.fromkeys(
+        name for combined in combined_series.values() for name in combined.index
+    ))
+    merged_df = pd.DataFrame(combined_series, index=coefficient_names)
+
+    coefficients = [
+        [str(name), *map(str, row)] 
+        for name, row in zip(merged_df.index, merged_df.to_numpy(dtype=object, na_value=''))
+    ]
 
     ## Fixed effects (if any)
     included_effects = [', '.join(result.included_effects)  for result in results]
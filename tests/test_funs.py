@@ -0,0 +1,132 @@
+import contextlib
+import io
+import unittest
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from regtabletotext.funs import calculate_residuals_statistics, clean_model_formula, prettify_result, prettify_results
+
+try:
+    from linearmodels import PanelOLS
+except ImportError:
+    PanelOLS = None
+
+
+def create_panel_data():
+    rng = np.random.default_rng(42)
+    index = pd.MultiIndex.from_product([range(20), range(5)], names=['entity', 'time'])
+    data = pd.DataFrame({'x1': rng.normal(size=100), 'x2': rng.normal(size=100)}, index=index)
+    data['y'] = 1.5 * data['x1'] - 0.5 * data['x2'] + rng.normal(size=100)
+    return data
+
+def capture_output(function, *args, **kwargs):
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        function(*args, **kwargs)
+    return output.getvalue()
+
+
+class TestCleanModelFormula(unittest.TestCase):
+
+    def test_wrapped_lines_fit_max_width(self):
+        # 'union+married' breaks before a term without a leading space, whose ' + ' prefix adds three
+        # characters; the last line must not grow to 31 characters by counting only two of them
+        model_formula = 'log_wage ~ experience + experience_squared + union+married + black + south_west'
+        lines = clean_model_formula(model_formula, {'max_width': 30}).split('\n')
+        self.assertEqual(lines, [
+            'log_wage ~ experience',
+            ' + experience_squared + union',
+            ' + married + black',
+            ' + south_west'
+        ])
+        for line in lines:
+            self.assertLessEqual(len(line), 30)
+
+    def test_term_wider_than_max_width(self):
+        # A term that cannot fit is kept on a line of its own, and the remaining terms are wrapped after it
+        model_formula = 'y ~ x1 + a_very_long_interaction_term:with_many_parts + x2 + x3'
+        lines = clean_model_formula(model_formula, {'max_width': 30}).split('\n')
+        self.assertEqual(lines, ['y ~ x1', ' + a_very_long_interaction_term:with_many_parts', ' + x2 + x3'])
+
+    def test_continuation_after_plus_without_space(self):
+        lines = clean_model_formula('y ~ aaaa+bbbb + c', {'max_width': 10}).split('\n')
+        self.assertEqual(lines, ['y ~ aaaa', ' + bbbb', ' + c'])
+
+
+class TestCalculateResidualsStatistics(unittest.TestCase):
+
+    def assert_matches_describe(self, residuals, expected_residuals):
+        expected = pd.Series(expected_residuals, dtype=float).describe().iloc[1:].round(3)
+        residuals_stats = calculate_residuals_statistics(residuals, {'digits': 3})
+        self.assertEqual(list(residuals_stats.columns), ["Mean", "Std", "Min", "25%", "50%", "75%", "Max"])
+        np.testing.assert_array_equal(residuals_stats.iloc[0].to_numpy(), expected.to_numpy())
+
+    def test_ndarray_matches_describe(self):
+        # arch results expose their residuals as a numpy array, which has no describe()
+        residuals = np.array([0.5, -1.25, 2.0, 0.125, -0.75, 1.5])
+        self.assert_matches_describe(residuals, residuals)
+
+    def test_series_with_missing_values_matches_describe(self):
+        residuals = pd.Series([0.5, np.nan, -1.25, 2.0, np.nan, 0.125])
+        self.assert_matches_describe(residuals, residuals)
+
+    def test_missing_residuals_return_missing_statistics(self):
+        for residuals in (pd.Series([], dtype=float), pd.Series([np.nan, np.nan])):
+            residuals_stats = calculate_residuals_statistics(residuals, {'digits': 3})
+            self.assertEqual(list(residuals_stats.columns), ["Mean", "Std", "Min", "25%", "50%", "75%", "Max"])
+            self.assertTrue(residuals_stats.isna().all(axis=None))
+
+    def test_single_residual_has_missing_std_without_warnings(self):
+        residuals = pd.Series([1.5, np.nan])
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            self.assert_matches_describe(residuals, residuals)
+
+
+@unittest.skipIf(PanelOLS is None, "linearmodels is not installed")
+class TestPrettifyResultList(unittest.TestCase):
+
+    def setUp(self):
+        data = create_panel_data()
+        self.results = [
+            PanelOLS.from_formula('y ~ x1 + EntityEffects', data=data).fit(),
+            PanelOLS.from_formula('y ~ x1 + x2 + EntityEffects', data=data).fit()
+        ]
+
+    def test_invalid_option_raises(self):
+        with self.assertRaises(ValueError):
+            prettify_result(self.results, {'digits': 3, 'decimals': 3})
+
+    def test_digits_are_passed_to_prettify_results(self):
+        output = capture_output(prettify_result, self.results, {'digits': 5})
+        self.assertEqual(output, capture_output(prettify_results, self.results, {'digits': 5}))
+        self.assertNotEqual(output, capture_output(prettify_results, self.results))
+
+
+@unittest.skipIf(PanelOLS is None, "linearmodels is not installed")
+class TestPrettifyResultLinearmodels(unittest.TestCase):
+
+    def setUp(self):
+        self.data = create_panel_data()
+
+    def assert_f_statistic_line(self, output, result):
+        f_statistic_line = f"- F-statistic: {result.f_statistic.stat:,.3f}, p-value: {result.f_statistic.pval:.3f}"
+        self.assertEqual(output.rstrip('\n').split('\n')[-1], f_statistic_line)
+
+    def test_formula_fit(self):
+        result = PanelOLS.from_formula('y ~ x1 + x2 + EntityEffects', data=self.data).fit()
+        output = capture_output(prettify_result, result, {'max_width': 20})
+        self.assertTrue(output.startswith("Panel OLS Model:\ny ~ x1 + x2\n + EntityEffects\n\n"))
+        self.assert_f_statistic_line(output, result)
+
+    def test_fit_without_formula(self):
+        result = PanelOLS(self.data['y'], self.data[['x1', 'x2']], entity_effects=True).fit()
+        output = capture_output(prettify_result, result)
+        self.assertTrue(output.startswith("Panel OLS Model (no formula provided)\n\n"))
+        self.assert_f_statistic_line(output, result)
+
+
+if __name__ == '__main__':
+    unittest.main()